@@ -1,16 +1,65 @@
 import argparse
+import functools
 import logging
+import mmap
 import os
+import sys
+import threading
 import json
+from concurrent.futures import ThreadPoolExecutor
 from rich.console import Console
 from rich.table import Column, Table
 
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    # Compiled inner loop; build with `python setup.py build_ext --inplace`.
+    import _core
+except ImportError:
+    _core = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
 
 # Default configuration file path
 DEFAULT_CONFIG_FILE = "config.json"
 
+# Permission values that count as access for blast-radius purposes.
+# Members are interned so comparisons against interned config strings
+# reduce to pointer equality in CPython.
+ALLOWED_PERMISSIONS = frozenset({sys.intern("read"), sys.intern("write")})
+
+# Numeric ranks for criticality levels; unknown levels sort last
+CRITICALITY_RANKS = {"high": 3, "medium": 2, "low": 1}
+CRITICALITY_LEVELS = {rank: level for level, rank in CRITICALITY_RANKS.items()}
+
+# Transitive closure of the nested-group graph (member -> all ancestor
+# groups), built once per config via set_group_graph.
+_group_closure = {}
+
+# Result-set size above which ranking switches to NumPy's C-level argsort;
+# below this the setup cost outweighs the win and Python's sort is faster.
+_NUMPY_SORT_THRESHOLD = 2048
+
+# Result-set size above which display falls back to plain tab-separated
+# output; Rich measures and styles every cell, which dominates wall time
+# on large tables.
+_RICH_TABLE_MAX_ROWS = 200
+
 
 def setup_argparse():
     """
@@ -40,15 +89,37 @@ def setup_argparse():
         help="Path to the output file to store results (optional)."
     )
 
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent the JSON output file for human reading; default is "
+             "compact, which is faster to write and roughly half the bytes."
+    )
+
+    parser.add_argument(
+        "--parallel",
+        action="store_true",
+        help="Check resources concurrently with a thread pool. Only worthwhile "
+             "when access checks hit a real directory backend (LDAP/AD); for "
+             "in-memory permission tables the default sequential path is faster."
+    )
+
     return parser.parse_args()
 
 
-def load_configuration(config_file):
+def load_configuration(config_file, user=None):
     """
     Loads configuration data from a JSON file.
 
+    When ijson is installed and a user is given, the "permissions" section is
+    streamed and only the entries for that user and their groups are kept, so
+    large ACL exports never have to be materialized in full. Otherwise the
+    whole file is parsed with the stdlib json module.
+
     Args:
         config_file (str): The path to the configuration file.
+        user (str, optional): If given, restrict the loaded permissions to
+            this user and their groups.
 
     Returns:
         dict: The configuration data as a dictionary.
@@ -58,22 +129,122 @@ def load_configuration(config_file):
         json.JSONDecodeError: If the configuration file is not valid JSON.
     """
     try:
-        with open(config_file, 'r') as f:
-            config = json.load(f)
-        logging.info(f"Configuration loaded from {config_file}")
-        return config
+        if ijson is not None and user is not None:
+            config = _load_configuration_streaming(config_file, user)
+        else:
+            if orjson is not None:
+                # orjson parses bytes directly and is several times faster than
+                # the stdlib; its JSONDecodeError subclasses the stdlib one.
+                # Memory-mapping lets it read straight from the page cache
+                # without an intermediate bytes copy.
+                with open(config_file, 'rb') as f:
+                    try:
+                        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                    except (ValueError, OSError):
+                        # Empty or non-regular file (e.g. a pipe) cannot be
+                        # mapped; fall back to a plain read.
+                        config = orjson.loads(f.read())
+                    else:
+                        try:
+                            # memoryview is the zero-copy bytes-like wrapper
+                            # orjson accepts.
+                            config = orjson.loads(memoryview(mm))
+                        finally:
+                            mm.close()
+            else:
+                with open(config_file, 'r') as f:
+                    config = json.load(f)
+            if isinstance(config, dict):
+                set_group_graph(config.get("groups", {}))
+        logger.info("Configuration loaded from %s", config_file)
+        return _intern_config(config)
     except FileNotFoundError:
-        logging.error(f"Configuration file not found: {config_file}")
+        logger.error("Configuration file not found: %s", config_file)
         raise
     except json.JSONDecodeError:
-        logging.error(f"Invalid JSON in configuration file: {config_file}")
+        logger.error("Invalid JSON in configuration file: %s", config_file)
         raise
 
 
+def _load_configuration_streaming(config_file, user):
+    """
+    Streams the configuration with ijson, keeping only the permission entries
+    relevant to the given user and their groups.
+
+    Args:
+        config_file (str): The path to the configuration file.
+        user (str): The user whose permission entries should be kept.
+
+    Returns:
+        dict: The configuration data, with "permissions" filtered down to the
+        user and their groups.
+    """
+    config = {}
+    try:
+        with open(config_file, 'rb') as f:
+            # The group graph must be installed before membership is resolved,
+            # otherwise nested-group principals would be filtered out below.
+            for group_graph in ijson.items(f, 'groups'):
+                config["groups"] = group_graph
+            set_group_graph(config.get("groups", {}))
+            principals = {user, *simulate_group_membership(user)}
+            f.seek(0)
+            for resources in ijson.items(f, 'resources'):
+                config["resources"] = resources
+            f.seek(0)
+            for criticality in ijson.items(f, 'criticality'):
+                config["criticality"] = criticality
+            f.seek(0)
+            config["permissions"] = {
+                principal: grants
+                for principal, grants in ijson.kvitems(f, 'permissions')
+                if principal in principals
+            }
+    except ijson.JSONError as e:
+        # Normalize to the stdlib exception so callers handle one error type.
+        raise json.JSONDecodeError(str(e), "", 0) from e
+    return config
+
+
+def _intern_config(config):
+    """
+    Interns the principal, resource, and permission strings in a loaded
+    configuration, so later dict lookups and equality checks against them
+    reduce to pointer comparisons in CPython.
+
+    Args:
+        config (dict): The configuration dictionary to intern in place.
+
+    Returns:
+        dict: The same configuration dictionary.
+    """
+    permissions = config.get("permissions")
+    if isinstance(permissions, dict):
+        config["permissions"] = {
+            sys.intern(principal): {
+                sys.intern(resource): sys.intern(permission)
+                for resource, permission in grants.items()
+            }
+            for principal, grants in permissions.items()
+        }
+    resources = config.get("resources")
+    if isinstance(resources, list):
+        config["resources"] = [sys.intern(r) for r in resources]
+    criticality = config.get("criticality")
+    if isinstance(criticality, dict):
+        config["criticality"] = {sys.intern(r): sys.intern(c) for r, c in criticality.items()}
+    return config
+
+
 def simulate_access(user, resource, permissions_data):
     """
     Simulates access to a resource based on the user and permissions data.
 
+    An explicit grant on the user decides the answer outright — a
+    non-allowed grant denies access even when a group would allow it — and
+    group grants are only consulted when the user has no entry. This is the
+    same rule the bulk path applies via _build_checker_state.
+
     Args:
         user (str): The user to simulate access for.
         resource (str): The resource to check access to.
@@ -82,49 +253,289 @@ def simulate_access(user, resource, permissions_data):
     Returns:
         bool: True if the user has access to the resource, False otherwise.
     """
-
-    try:
-        # Check user-specific permissions
-        if user in permissions_data and resource in permissions_data[user]:
-            if permissions_data[user][resource] == "read" or permissions_data[user][resource] == "write":
-                logging.info(f"User {user} has explicit {permissions_data[user][resource]} access to {resource}.")
-                return True
-
-        # Simulate group membership and check group permissions (placeholder)
-        # Replace with actual group membership logic
-        groups = simulate_group_membership(user) # Use helper function
-
-        for group in groups:
-             if group in permissions_data:
-                if resource in permissions_data[group]:
-                    if permissions_data[group][resource] == "read" or permissions_data[group][resource] == "write":
-                        logging.info(f"User {user} has {permissions_data[group][resource]} access to {resource} via group {group}.")
-                        return True
-        logging.info(f"User {user} does not have access to {resource}.")
-        return False
-    except Exception as e:
-        logging.error(f"Error simulating access to {resource}: {e}")
+    # Straight-line lookups with early returns; .get() keeps the path free
+    # of KeyErrors, so no try/except setup cost per call and no blanket
+    # handler hiding real bugs. main validates permissions_data up front.
+
+    # Check user-specific permissions. An explicit grant decides the answer
+    # either way: a non-allowed grant overrides group grants, matching the
+    # user_denied rule in _build_checker_state.
+    perm = permissions_data.get(user, {}).get(resource)
+    if perm is not None:
+        if perm in ALLOWED_PERMISSIONS:
+            logger.debug("User %s has explicit %s access to %s.", user, perm, resource)
+            return True
+        logger.debug("User %s is explicitly denied access to %s (grant: %s).", user, resource, perm)
         return False
 
+    # Simulate group membership and check group permissions (placeholder)
+    # Replace with actual group membership logic
+    for group in simulate_group_membership(user):
+        perm = permissions_data.get(group, {}).get(resource)
+        if perm in ALLOWED_PERMISSIONS:
+            logger.debug("User %s has %s access to %s via group %s.", user, perm, resource, group)
+            return True
+
+    logger.debug("User %s does not have access to %s.", user, resource)
+    return False
+
+def _compute_group_closure(adjacency):
+    """
+    Computes the transitive closure of a nested-group graph.
+
+    Uses semi-naive iteration: each round only propagates the ancestors
+    discovered in the previous round, so the total work is proportional to
+    the closure size rather than repeated full re-derivations. Cycles in the
+    graph terminate naturally because already-known ancestors are subtracted
+    from each round's frontier.
+
+    Args:
+        adjacency (dict): A mapping of member -> list of parent groups.
+
+    Returns:
+        dict: A mapping of member -> frozenset of all ancestor groups.
+    """
+    closure = {}
+    frontier = {member: set(parents) for member, parents in adjacency.items()}
+    while frontier:
+        next_frontier = {}
+        for member, parents in frontier.items():
+            known = closure.setdefault(member, set())
+            delta = set()
+            for parent in parents:
+                delta.update(adjacency.get(parent, ()))
+            delta -= known | parents
+            known |= parents
+            if delta:
+                next_frontier[member] = delta
+        frontier = next_frontier
+    return {member: frozenset(ancestors) for member, ancestors in closure.items()}
+
+
+def set_group_graph(group_graph):
+    """
+    Installs a nested-group graph and precomputes its transitive closure.
+
+    Call this whenever the configuration is (re)loaded; it also clears the
+    memoized membership results so they are re-derived against the new graph.
+
+    Args:
+        group_graph (dict): A mapping of member -> list of parent groups, as
+            found in the optional "groups" section of the configuration.
+    """
+    global _group_closure
+    _group_closure = _compute_group_closure(group_graph) if group_graph else {}
+    simulate_group_membership.cache_clear()
+
+
+@functools.lru_cache(maxsize=4096)
 def simulate_group_membership(user):
     """Simulates Group Membership
+
+    Results are memoized per user for the lifetime of the process, so a real
+    directory backend would pay the lookup round-trip once per user. Call
+    simulate_group_membership.cache_clear() to invalidate (e.g. after a
+    membership change); a backend with revocations should put a TTL cache in
+    front of the directory instead of relying on this unbounded-lifetime one.
+
     Args:
         user (str): The user that we want to get group membership for
 
     Returns:
-        list: returns a list of the groups a user belongs to
+        tuple: the groups the user belongs to, including ancestors reached
+        through the nested-group graph installed via set_group_graph
     """
     #This is an extremely simplified example.  In a real implementation, this would
     #interact with an actual user/group directory (LDAP, Active Directory, etc.)
     #or a local database of group memberships.
     if user == "john.doe":
-        return ["developers", "testers"]
+        direct = ("developers", "testers")
     elif user == "jane.smith":
-        return ["administrators"]
+        direct = ("administrators",)
     else:
+        direct = ()
+
+    # Expand through the precomputed transitive closure so membership in a
+    # nested group implies membership in all of its ancestors.
+    expanded = set(direct)
+    expanded.update(_group_closure.get(user, ()))
+    for group in direct:
+        expanded.update(_group_closure.get(group, ()))
+    return tuple(sorted(expanded))
+
+def _build_resource_index(permissions_data):
+    """
+    Inverts the principal-oriented permissions layout into a resource-oriented
+    one, so all grants on a resource are reachable with a single lookup.
+
+    Args:
+        permissions_data (dict): A dictionary mapping principals to their
+            resource->permission grants.
+
+    Returns:
+        dict: A dictionary mapping each resource to a {principal: permission}
+        dictionary of the grants on it.
+    """
+    resource_index = {}
+    for principal, grants in permissions_data.items():
+        for resource, permission in grants.items():
+            resource_index.setdefault(resource, {})[principal] = permission
+    return resource_index
+
+
+def _build_grant_masks(resource_index):
+    """
+    Encodes the allowed grants on each resource as a bitmask over principals.
+
+    Each distinct principal holding an allowed permission gets a bit position;
+    a resource's mask ORs the bits of every principal allowed on it. A
+    permission check then reduces to a single integer AND against the
+    querying user's principal mask.
+
+    Args:
+        resource_index (dict): The resource->{principal: permission} index
+            from _build_resource_index.
+
+    Returns:
+        tuple: (principal_ids, resource_grant_masks) where principal_ids maps
+        each principal to its bit position and resource_grant_masks maps each
+        resource to the OR of its allowed principals' bits.
+    """
+    principal_ids = {}
+    resource_grant_masks = {}
+    for resource, grants in resource_index.items():
+        mask = 0
+        for principal, permission in grants.items():
+            if permission in ALLOWED_PERMISSIONS:
+                bit = principal_ids.setdefault(principal, len(principal_ids))
+                mask |= 1 << bit
+        if mask:
+            resource_grant_masks[resource] = mask
+    return principal_ids, resource_grant_masks
+
+
+def _build_checker_state(user, permissions_data):
+    """
+    Does the per-user setup shared by the access-check paths: group
+    resolution, inverting the permissions table, and encoding grants as
+    principal bitmasks.
+
+    Args:
+        user (str): The user to build state for.
+        permissions_data (dict): A dictionary containing user/group permissions.
+
+    Returns:
+        tuple: (grant_masks, user_mask, user_denied) — the resource->mask
+        table restricted to the user's principals, the user's principal mask,
+        and the resources where an explicit user grant overrides group grants.
+    """
+    groups = simulate_group_membership(user)
+
+    # Only the user's own principals can grant access, so restrict the
+    # inversion to them: the resulting mask table covers exactly the
+    # candidate resources reachable by this user, and every other resource
+    # is rejected by the plain dict miss in check() with no further work.
+    # Setup cost likewise scales with the user's grants, not the full table.
+    relevant = {
+        principal: permissions_data[principal]
+        for principal in (user, *groups)
+        if principal in permissions_data
+    }
+    resource_index = _build_resource_index(relevant)
+    principal_ids, grant_masks = _build_grant_masks(resource_index)
+
+    user_mask = 0
+    for principal in (user, *groups):
+        bit = principal_ids.get(principal)
+        if bit is not None:
+            user_mask |= 1 << bit
+
+    # Resources where the user holds an explicit non-allowed grant; that
+    # grant overrides any group grant.
+    user_grants = permissions_data.get(user, {})
+    user_denied = {r for r, p in user_grants.items() if p not in ALLOWED_PERMISSIONS}
+
+    return grant_masks, user_mask, user_denied
+
+
+def make_checker(user, permissions_data):
+    """
+    Builds an access checker specialized for one user over one permissions
+    table.
+
+    All the per-user work is done once in _build_checker_state, so the
+    returned callable is a closure over prebound lookups: one dict.get, one
+    integer AND, and one set containment per resource.
+
+    Args:
+        user (str): The user to specialize the checker for.
+        permissions_data (dict): A dictionary containing user/group permissions.
+
+    Returns:
+        callable: A function resource -> bool answering whether the user can
+        access that resource.
+    """
+    grant_masks, user_mask, user_denied = _build_checker_state(user, permissions_data)
+    masks_get = grant_masks.get
+
+    def check(resource):
+        return bool(masks_get(resource, 0) & user_mask) and resource not in user_denied
+
+    return check
+
+
+def _assess_access_sequential(user, resources, permissions_data):
+    """
+    Returns the resources the user can access, using the compiled inner loop
+    when the _core extension is built, or an equivalent Python comprehension
+    otherwise.
+
+    Args:
+        user (str): The user to check access for.
+        resources (list): The resources to check.
+        permissions_data (dict): A dictionary containing user/group permissions.
+
+    Returns:
+        list: The subset of resources the user can access, in input order.
+    """
+    if _core is not None:
+        grant_masks, user_mask, user_denied = _build_checker_state(user, permissions_data)
+        return _core.check_resources(resources, grant_masks, user_mask, user_denied)
+    check = make_checker(user, permissions_data)
+    return [resource for resource in resources if check(resource)]
+
+
+def _assess_access_parallel(user, resources, permissions_data):
+    """
+    Returns the resources the user can access, checking them concurrently
+    with a thread pool.
+
+    Each resource is checked via simulate_access, so this path is only
+    worthwhile when access checks involve real I/O (e.g. an LDAP/AD backend)
+    that releases the GIL; for pure in-memory tables the sequential bitmask
+    path is faster. simulate_access applies the same explicit-user-grant
+    override rule as the sequential checker, so --parallel affects timing
+    only, never which resources are reported.
+
+    Args:
+        user (str): The user to check access for.
+        resources (list): The resources to check.
+        permissions_data (dict): A dictionary containing user/group permissions.
+
+    Returns:
+        list: The subset of resources the user can access, in input order.
+    """
+    if not resources:
         return []
+    with ThreadPoolExecutor(max_workers=min(32, len(resources))) as executor:
+        access = executor.map(
+            lambda resource: simulate_access(user, resource, permissions_data),
+            resources,
+        )
+        return [resource for resource, allowed in zip(resources, access) if allowed]
+
 
-def assess_impact(user, resources, permissions_data, criticality_data):
+def assess_impact(user, resources, permissions_data, criticality_data, parallel=False):
     """
     Assesses the impact of a compromised identity by mapping permissions to
     critical resources.
@@ -134,23 +545,53 @@ def assess_impact(user, resources, permissions_data, criticality_data):
         resources (list): A list of resources to assess.
         permissions_data (dict): A dictionary containing user/group permissions.
         criticality_data (dict): A dictionary containing criticality levels for resources.
+        parallel (bool): If True, check resources concurrently with a thread
+            pool; only worthwhile when access checks involve real I/O.
 
     Returns:
         list: A ranked list of high-impact targets.
     """
-    high_impact_targets = []
-    for resource in resources:
-        try:
-            if simulate_access(user, resource, permissions_data):
-                criticality = criticality_data.get(resource, "low")  # Default to low
-                high_impact_targets.append({"resource": resource, "criticality": criticality})
-                logging.info(f"User {user} has access to {resource} (criticality: {criticality}).")
-
-        except Exception as e:
-            logging.error(f"Error processing resource {resource}: {e}")
-
-    # Rank targets by criticality (high > medium > low)
-    ranked_targets = sorted(high_impact_targets, key=lambda x: {"high": 3, "medium": 2, "low": 1}[x["criticality"]], reverse=True)
+    if parallel:
+        accessible = _assess_access_parallel(user, resources, permissions_data)
+    else:
+        accessible = _assess_access_sequential(user, resources, permissions_data)
+
+    # Map each rated resource straight to its integer rank so the per-target
+    # work is one dict lookup returning a small cached int; resources without
+    # a rating (or with an unknown level) default to the "low" rank. The
+    # criticality string is only recovered when the final dicts are built.
+    crit_ranks = {
+        resource: CRITICALITY_RANKS.get(level, 1)
+        for resource, level in criticality_data.items()
+    }
+
+    target_resources = []
+    target_ranks = []
+    for resource in accessible:
+        target_resources.append(resource)
+        target_ranks.append(crit_ranks.get(resource, 1))
+
+    # Rank targets by criticality (high > medium > low). For large result
+    # sets NumPy's C-level argsort on the int8 ranks beats Python's sort.
+    if np is not None and len(target_ranks) > _NUMPY_SORT_THRESHOLD:
+        order = np.argsort(-np.asarray(target_ranks, dtype=np.int8), kind="stable")
+    else:
+        order = sorted(range(len(target_ranks)), key=target_ranks.__getitem__, reverse=True)
+
+    ranked_targets = [
+        {
+            "resource": target_resources[i],
+            "criticality": CRITICALITY_LEVELS[target_ranks[i]],
+        }
+        for i in order
+    ]
+
+    if logger.isEnabledFor(logging.DEBUG):
+        for target in ranked_targets:
+            logger.debug(
+                "User %s has access to %s (criticality: %s).",
+                user, target["resource"], target["criticality"],
+            )
 
     return ranked_targets
 
@@ -159,9 +600,19 @@ def display_results(ranked_targets):
     """
     Displays the results in a user-friendly format using Rich.
 
+    Above _RICH_TABLE_MAX_ROWS targets, falls back to plain tab-separated
+    output on stdout, skipping Rich's per-cell width measurement and styling.
+
     Args:
         ranked_targets (list): A list of ranked high-impact targets.
     """
+    if len(ranked_targets) > _RICH_TABLE_MAX_ROWS:
+        sys.stdout.write("Resource\tCriticality\n")
+        sys.stdout.writelines(
+            f"{target['resource']}\t{target['criticality']}\n" for target in ranked_targets
+        )
+        return
+
     console = Console()
     table = Table(title="Potential Impact of Compromised Identity")
 
@@ -174,20 +625,30 @@ def display_results(ranked_targets):
     console.print(table)
 
 
-def save_results(ranked_targets, output_file):
+def save_results(ranked_targets, output_file, pretty=False):
     """
     Saves the results to a file in JSON format.
 
     Args:
         ranked_targets (list): A list of ranked high-impact targets.
         output_file (str): The path to the output file.
+        pretty (bool): If True, indent the output for human reading. The
+            compact default is faster to encode and roughly half the bytes.
     """
     try:
-        with open(output_file, 'w') as f:
-            json.dump(ranked_targets, f, indent=4)
-        logging.info(f"Results saved to {output_file}")
+        if orjson is not None:
+            option = orjson.OPT_INDENT_2 if pretty else orjson.OPT_APPEND_NEWLINE
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(ranked_targets, option=option))
+        else:
+            with open(output_file, 'w') as f:
+                if pretty:
+                    json.dump(ranked_targets, f, indent=2)
+                else:
+                    json.dump(ranked_targets, f, separators=(',', ':'))
+        logger.info("Results saved to %s", output_file)
     except Exception as e:
-        logging.error(f"Error saving results to {output_file}: {e}")
+        logger.error("Error saving results to %s: %s", output_file, e)
 
 
 def main():
@@ -197,9 +658,8 @@ def main():
     args = setup_argparse()
 
     try:
-        config = load_configuration(args.config)
-
         user = args.user
+        config = load_configuration(args.config, user=user)
         resources = config.get("resources", [])
         permissions_data = config.get("permissions", {})
         criticality_data = config.get("criticality", {})
@@ -212,12 +672,27 @@ def main():
         if not isinstance(criticality_data, dict):
             raise ValueError("Criticality must be a dictionary in the configuration file.")
 
-        ranked_targets = assess_impact(user, resources, permissions_data, criticality_data)
+        # Dedupe while preserving order so repeated entries are checked once,
+        # and iterate a tuple, which is slightly cheaper than a list.
+        resources = tuple(dict.fromkeys(resources))
 
-        display_results(ranked_targets)
+        ranked_targets = assess_impact(user, resources, permissions_data, criticality_data, parallel=args.parallel)
 
         if args.output:
-            save_results(ranked_targets, args.output)
+            # Saving and rendering both only read ranked_targets, and each
+            # spends its time in GIL-releasing writes, so overlap them.
+            save_thread = threading.Thread(
+                target=save_results,
+                args=(ranked_targets, args.output),
+                kwargs={"pretty": args.pretty},
+            )
+            save_thread.start()
+            try:
+                display_results(ranked_targets)
+            finally:
+                save_thread.join()
+        else:
+            display_results(ranked_targets)
 
     except FileNotFoundError:
         print("Error: Configuration file not found. Please check the path.")
@@ -229,7 +704,7 @@ def main():
         print(f"Error: {e}")
         exit(1)
     except Exception as e:
-        logging.exception("An unexpected error occurred:")
+        logger.exception("An unexpected error occurred:")
         print(f"An unexpected error occurred: {e}")
         exit(1)
 
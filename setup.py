@@ -0,0 +1,17 @@
+"""
+Optional build script for the compiled inner loop (_core.pyx).
+
+The tool runs without it; building the extension just speeds up the
+per-resource access loop on large resource lists:
+
+    pip install cython
+    python setup.py build_ext --inplace
+"""
+from setuptools import Extension, setup
+
+from Cython.Build import cythonize
+
+setup(
+    name="pa-permission-blast-radius-calculator",
+    ext_modules=cythonize([Extension("_core", ["_core.pyx"])]),
+)